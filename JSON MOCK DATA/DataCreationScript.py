@@ -3,6 +3,7 @@
 File: mock_log_generator.py
 
 Generates mock log data and writes mockData.json.
+Output is compact JSON; pass --pretty for 2-space indented output.
 
 All record values are int/float (except the dict key ID-##########).
 
@@ -24,12 +25,20 @@ Record schema:
 
 from __future__ import annotations
 
+import argparse
 import json
-import random
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: faster serializer, falls back to stdlib json
+    orjson = None
 
 
 NORMAL_EXTENSIONS = [".txt", ".xlsx", ".doc", ".xml", ".zip", ".png", ".pdf"]
@@ -71,6 +80,7 @@ class DateRange:
 DATE_RANGE_2025_FROM_APRIL = DateRange(start=date(2025, 4, 1), end=date(2025, 12, 31))
 
 
+@lru_cache(maxsize=64)
 def _normalize_ext(ext: str) -> str:
     key = (ext or "").strip().lower()
     if not key:
@@ -98,41 +108,63 @@ def _build_ext_id_map() -> Dict[str, int]:
 EXT_TO_ID = _build_ext_id_map()
 
 
-def _random_id(existing: set[str]) -> str:
-    while True:
-        key = f"ID-{random.randint(0, 9_999_999_999):010d}"
-        if key not in existing:
-            return key
+ID_SPACE = 10_000_000_000  # ID-0000000000 .. ID-9999999999
+
+
+def _random_ids(rng: np.random.Generator, n: int) -> list[str]:
+    """
+    n distinct record keys, drawn without replacement (no reject-and-retry loop).
+    """
+    # %-formatting is measurably cheaper than an f-string with a format spec here.
+    return ["ID-%010d" % num for num in rng.choice(ID_SPACE, size=n, replace=False).tolist()]
+
+
+DAY_MS = 86_400_000
+HOUR_MS = 3_600_000
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
-def _random_date_in_range(dr: DateRange) -> date:
-    span_days = (dr.end - dr.start).days
-    return dr.start + timedelta(days=random.randint(0, span_days))
+def _epoch_ms_utc(d: date, sec: int = 0, ms: int = 0) -> int:
+    """
+    Epoch milliseconds of d + sec seconds + ms milliseconds (UTC), by day-ordinal arithmetic.
+    """
+    return (d.toordinal() - EPOCH_ORDINAL) * DAY_MS + sec * 1000 + ms
 
 
-def _epoch_ms_utc(dt: datetime) -> int:
-    dt_utc = dt.replace(tzinfo=timezone.utc)
-    return int(dt_utc.timestamp() * 1000)
+# EXT_DANGER clamped to [0, 1] once, so lookups need no per-call checks.
+_EXT_DANGER_CLAMPED: Dict[str, float] = {k: float(max(0.0, min(1.0, v))) for k, v in EXT_DANGER.items()}
 
 
 def _danger_for_extension(ext: str) -> float:
-    key = _normalize_ext(ext)
-    score = EXT_DANGER.get(key, 1.0)
-    if not isinstance(score, (int, float)):
-        return 1.0
-    return float(max(0.0, min(1.0, score)))
+    return _EXT_DANGER_CLAMPED.get(_normalize_ext(ext), 1.0)
 
 
 def _ext_id(ext: str) -> int:
     return int(EXT_TO_ID.get(_normalize_ext(ext), 0))
 
 
-def _random_extension(pool: list[str]) -> str:
-    return random.choice(pool)
+# Per-pool lookups indexed by position in the pool, so drawn indices map straight to values.
+NORMAL_EXT_IDS = np.asarray([_ext_id(e) for e in NORMAL_EXTENSIONS], dtype=np.int64)
+NORMAL_EXT_DANGERS = np.asarray([_danger_for_extension(e) for e in NORMAL_EXTENSIONS], dtype=np.float64)
+OUTLIER_EXT_IDS = np.asarray([_ext_id(e) for e in OUTLIER_EXTENSIONS], dtype=np.int64)
+OUTLIER_EXT_DANGERS = np.asarray([_danger_for_extension(e) for e in OUTLIER_EXTENSIONS], dtype=np.float64)
 
 
-def _random_file_length(min_len: int, max_len: int) -> int:
-    return random.randint(min_len, max_len)
+def _build_work_weight_lut() -> Tuple[int, ...]:
+    """
+    Expands WORK_WEIGHT_BY_BUCKET ("HH-HH", end exclusive) into one weight per hour 0-23.
+    Hours not covered by any bucket get 1.
+    """
+    lut = [1] * 24
+    for bucket, weight in WORK_WEIGHT_BY_BUCKET.items():
+        start_hour, end_hour = (int(h) for h in bucket.split("-"))
+        for hour in range(start_hour, end_hour):
+            lut[hour] = int(weight)
+    return tuple(lut)
+
+
+_WORK_WEIGHT_LUT = _build_work_weight_lut()
+_WORK_WEIGHT_LUT_NP = np.asarray(_WORK_WEIGHT_LUT, dtype=np.int64)
 
 
 def _work_weight_for_hour(hour: int) -> int:
@@ -140,89 +172,105 @@ def _work_weight_for_hour(hour: int) -> int:
     Maps hour to your specified buckets.
     hour is 0-23.
     """
-    if 0 <= hour < 4:
-        return WORK_WEIGHT_BY_BUCKET["00-04"]
-    if 4 <= hour < 6:
-        return WORK_WEIGHT_BY_BUCKET["04-06"]
-    if 6 <= hour < 8:
-        return WORK_WEIGHT_BY_BUCKET["06-08"]
-    if 8 <= hour < 17:
-        return WORK_WEIGHT_BY_BUCKET["08-17"]
-    if 17 <= hour < 21:
-        return WORK_WEIGHT_BY_BUCKET["17-21"]
-    if 21 <= hour < 24:
-        return WORK_WEIGHT_BY_BUCKET["21-24"]
+    if 0 <= hour < 24:
+        return _WORK_WEIGHT_LUT[hour]
     return 1  # defensive fallback
 
 
-def _random_start_in_business_hours() -> datetime:
+DAY_SPAN = (DATE_RANGE_2025_FROM_APRIL.end - DATE_RANGE_2025_FROM_APRIL.start).days
+
+# Midnight UTC of DATE_RANGE_2025_FROM_APRIL.start; day N starts at BASE_EPOCH_MS + N * DAY_MS.
+BASE_EPOCH_MS = _epoch_ms_utc(DATE_RANGE_2025_FROM_APRIL.start)
+
+
+def _random_start_finish_in_business_hours(rng: np.random.Generator, n: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Business hours: 08:00:00.000 <= time < 17:00:00.000
+    Business hours: 08:00:00.000 <= start < 17:00:00.000, duration 1-120s.
+    Returns (start_ms, finish_ms) as int64 epoch milliseconds (UTC).
     """
-    d = _random_date_in_range(DATE_RANGE_2025_FROM_APRIL)
-    start_seconds = 8 * 3600
-    end_seconds_exclusive = 17 * 3600  # exclusive
-    sec = random.randint(start_seconds, end_seconds_exclusive - 1)
-    ms = random.randint(0, 999)
-    return datetime.combine(d, time(0, 0, 0)) + timedelta(seconds=sec, milliseconds=ms)
+    day_offset = rng.integers(0, DAY_SPAN + 1, n)
+    sec = rng.integers(8 * 3600, 17 * 3600, n)  # exclusive upper bound
+    ms = rng.integers(0, 1000, n)
+    start_ms = BASE_EPOCH_MS + day_offset * DAY_MS + sec * 1000 + ms
+    return start_ms, start_ms + rng.integers(1000, 120_001, n)
 
 
-def _random_start_finish_in_night_window() -> Tuple[datetime, datetime]:
+def _random_start_finish_in_night_window(rng: np.random.Generator, n: int) -> Tuple[np.ndarray, np.ndarray]:
     """
     Outlier window: start/finish constrained to 23:00-04:00.
-    We pick either:
+    Each record picks either:
       - late segment: 23:00-23:59:59.999
-      - early segment: 00:00-03:59:59.999
-    and cap duration to stay inside the segment.
+      - early segment: 00:00-03:59:59.999 (from 2025-04-02 onward)
+    and caps duration to stay inside the segment.
+    Returns (start_ms, finish_ms) as int64 epoch milliseconds (UTC).
     """
-    segment = random.choice(["late", "early"])
-
-    if segment == "late":
-        d = _random_date_in_range(DATE_RANGE_2025_FROM_APRIL)
-        seg_start = datetime.combine(d, time(23, 0, 0))
-        seg_end = datetime.combine(d, time(23, 59, 59, 999000))
-        start_offset_sec = random.randint(0, 59 * 60 + 59)
-        start_ms = random.randint(0, 999)
-        start_dt = seg_start + timedelta(seconds=start_offset_sec, milliseconds=start_ms)
-    else:
-        dr = DateRange(start=date(2025, 4, 2), end=DATE_RANGE_2025_FROM_APRIL.end)
-        d = _random_date_in_range(dr)
-        seg_start = datetime.combine(d, time(0, 0, 0))
-        seg_end = datetime.combine(d, time(3, 59, 59, 999000))
-        start_offset_sec = random.randint(0, 3 * 3600 + 59 * 60 + 59)
-        start_ms = random.randint(0, 999)
-        start_dt = seg_start + timedelta(seconds=start_offset_sec, milliseconds=start_ms)
+    late = rng.random(n) < 0.5
+
+    # The early segment skips the first day so it never precedes the range start.
+    day_offset = np.where(late, rng.integers(0, DAY_SPAN + 1, n), rng.integers(1, DAY_SPAN + 1, n))
+    day_ms = BASE_EPOCH_MS + day_offset * DAY_MS
 
-    max_duration_ms = max(1000, int((seg_end - start_dt).total_seconds() * 1000))
-    duration_ms = random.randint(1000, min(120_000, max_duration_ms))
-    finish_dt = start_dt + timedelta(milliseconds=duration_ms)
-    return start_dt, finish_dt
+    seg_start_ms = np.where(late, 23 * HOUR_MS, 0)
+    seg_end_ms = np.where(late, 24 * HOUR_MS - 1, 4 * HOUR_MS - 1)
+    start_offset_ms = rng.integers(0, seg_end_ms - seg_start_ms + 1)
+    start_ms = day_ms + seg_start_ms + start_offset_ms
 
+    max_duration_ms = np.maximum(1000, day_ms + seg_end_ms - start_ms)
+    duration_ms = rng.integers(1000, np.minimum(120_000, max_duration_ms) + 1)
+    return start_ms, start_ms + duration_ms
 
-def _record_from_times(
+
+TimeWindowFn = Callable[[np.random.Generator, int], Tuple[np.ndarray, np.ndarray]]
+
+
+def _generate_segment(
+    rng: np.random.Generator,
+    count: int,
     *,
-    ext: str,
-    file_len: int,
-    start_dt: datetime,
-    finish_dt: datetime,
-    success: int,
-) -> dict:
-    start_ms = _epoch_ms_utc(start_dt)
-    finish_ms = _epoch_ms_utc(finish_dt)
-    delta_s = (finish_ms - start_ms) / 1000.0
+    ext_ids: np.ndarray,
+    ext_dangers: np.ndarray,
+    file_len_range: Tuple[int, int],
+    time_fn: TimeWindowFn,
+    success_rate: float,
+) -> list[dict]:
+    """
+    Draws count records from one extension pool (ext_ids/ext_dangers), with
+    file_len in file_len_range (inclusive) and start/finish times from time_fn.
+    """
+    ext_idx = rng.integers(0, len(ext_ids), count)
+    file_len = rng.integers(file_len_range[0], file_len_range[1] + 1, count)
+    start_ms, finish_ms = time_fn(rng, count)
+    success = (rng.random(count) < success_rate).astype(np.int64)
 
-    hour = int(start_dt.hour)
-    return {
-        "ext_id": _ext_id(ext),
-        "file_len": int(file_len),
-        "ext_danger": float(_danger_for_extension(ext)),
-        "success": int(success),
-        "transfer_start_ms": int(start_ms),
-        "transfer_finish_ms": int(finish_ms),
-        "transfer_delta_s": float(delta_s),
-        "transfer_hour": hour,
-        "work_weight": int(_work_weight_for_hour(hour)),
-    }
+    delta_s = (finish_ms - start_ms) / 1000.0
+    hour = (start_ms // HOUR_MS) % 24
+
+    # .tolist() hands back native int/float so the records serialize as-is.
+    columns = zip(
+        ext_ids[ext_idx].tolist(),
+        file_len.tolist(),
+        ext_dangers[ext_idx].tolist(),
+        success.tolist(),
+        start_ms.tolist(),
+        finish_ms.tolist(),
+        delta_s.tolist(),
+        hour.tolist(),
+        np.take(_WORK_WEIGHT_LUT_NP, hour).tolist(),
+    )
+    return [
+        {
+            "ext_id": ext_id,
+            "file_len": flen,
+            "ext_danger": danger,
+            "success": ok,
+            "transfer_start_ms": start,
+            "transfer_finish_ms": finish,
+            "transfer_delta_s": delta,
+            "transfer_hour": hr,
+            "work_weight": weight,
+        }
+        for ext_id, flen, danger, ok, start, finish, delta, hr, weight in columns
+    ]
 
 
 def generate_mock_data(
@@ -230,55 +278,45 @@ def generate_mock_data(
     outlier_count: int = 20,
     success_rate: float = 0.99,
 ) -> Dict[str, dict]:
-    data: Dict[str, dict] = {}
-    existing_ids: set[str] = set()
-
-    def success_flag() -> int:
-        return 1 if random.random() < success_rate else 0
-
-    for _ in range(normal_count):
-        key = _random_id(existing_ids)
-        existing_ids.add(key)
-
-        ext = _random_extension(NORMAL_EXTENSIONS)
-        file_len = _random_file_length(1, 25)
+    rng = np.random.default_rng()
+
+    normal = _generate_segment(
+        rng,
+        normal_count,
+        ext_ids=NORMAL_EXT_IDS,
+        ext_dangers=NORMAL_EXT_DANGERS,
+        file_len_range=(1, 25),
+        time_fn=_random_start_finish_in_business_hours,
+        success_rate=success_rate,
+    )
+    outliers = _generate_segment(
+        rng,
+        outlier_count,
+        ext_ids=OUTLIER_EXT_IDS,
+        ext_dangers=OUTLIER_EXT_DANGERS,
+        file_len_range=(30, 60),
+        time_fn=_random_start_finish_in_night_window,
+        success_rate=success_rate,
+    )
+
+    ids = _random_ids(rng, normal_count + outlier_count)
+    return dict(zip(ids, normal + outliers))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate mock file transfer logs as mockData.json.")
+    parser.add_argument("--pretty", action="store_true", help="indent the JSON output for human reading")
+    args = parser.parse_args(argv)
 
-        start_dt = _random_start_in_business_hours()
-        duration_ms = random.randint(1000, 120_000)
-        finish_dt = start_dt + timedelta(milliseconds=duration_ms)
-
-        data[key] = _record_from_times(
-            ext=ext,
-            file_len=file_len,
-            start_dt=start_dt,
-            finish_dt=finish_dt,
-            success=success_flag(),
-        )
-
-    for _ in range(outlier_count):
-        key = _random_id(existing_ids)
-        existing_ids.add(key)
-
-        ext = _random_extension(OUTLIER_EXTENSIONS)
-        file_len = _random_file_length(30, 60)
-
-        start_dt, finish_dt = _random_start_finish_in_night_window()
-
-        data[key] = _record_from_times(
-            ext=ext,
-            file_len=file_len,
-            start_dt=start_dt,
-            finish_dt=finish_dt,
-            success=success_flag(),
-        )
-
-    return data
-
-
-def main() -> None:
     data = generate_mock_data(normal_count=1000, outlier_count=20, success_rate=0.99)
     out_path = Path("mockData.json")
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if args.pretty else None
+        out_path.write_bytes(orjson.dumps(data, option=option))
+    elif args.pretty:
+        out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    else:
+        out_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
     print(f"Wrote {len(data)} records to {out_path.resolve()}")
 
 
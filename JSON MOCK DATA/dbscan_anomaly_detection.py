@@ -12,12 +12,28 @@ Noise points (cluster = -1) are interpreted as suspicious activity.
 """
 
 import json
-from datetime import datetime, timezone
+import math
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
 from sklearn.cluster import DBSCAN
-from sklearn.preprocessing import StandardScaler
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parser, falls back to stdlib json
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: JIT-compiled feature kernels, NumPy otherwise
+    njit = None
+    prange = range
+
+try:
+    import pyarrow  # noqa: F401  (engine for DataFrame.to_parquet)
+except ImportError:  # optional: Parquet results, CSV otherwise
+    pyarrow = None
 
 
 # -----------------------------
@@ -31,29 +47,103 @@ DATA_FILE = r".\mockDataV2.json"
 EPS = 0.9
 MIN_SAMPLES = 8
 
+# Features for DBSCAN, in feature matrix column order
+# NOTE:
+# - ext_id is excluded (categorical, redundant)
+# - raw timestamps are excluded (distance meaningless)
+FEATURE_COLUMNS = [
+    "file_len",
+    "ext_danger",
+    "transfer_delta_s",
+    "hour_sin",
+    "hour_cos",
+]
+
 
 # -----------------------------
 # Helper functions
 # -----------------------------
 
-def hour_fraction_from_epoch_ms(epoch_ms: int) -> float:
+def hour_features_from_epoch_ms(epoch_ms: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Convert epoch milliseconds (UTC) into a fractional hour of day.
+    Convert epoch milliseconds (UTC) into fractional hour of day plus its
+    cyclical (sin, cos) encoding.
     Example: 13.5 = 13:30 UTC
     """
-    dt = datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
-    return dt.hour + dt.minute / 60 + dt.second / 3600
+    hour = ((epoch_ms // 1000) % 86400) / 3600.0
+    angle = (2 * np.pi / 24) * hour
+    return hour, np.sin(angle), np.cos(angle)
+
+
+def _hour_features_kernel(epoch_ms: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row-parallel loop form of hour_features_from_epoch_ms, for Numba to compile.
+    """
+    n = epoch_ms.shape[0]
+    hour = np.empty(n)
+    hour_sin = np.empty(n)
+    hour_cos = np.empty(n)
+    two_pi_over_24 = 2 * np.pi / 24
+    for i in prange(n):
+        h = ((epoch_ms[i] // 1000) % 86400) / 3600.0
+        hour[i] = h
+        hour_sin[i] = math.sin(two_pi_over_24 * h)
+        hour_cos[i] = math.cos(two_pi_over_24 * h)
+    return hour, hour_sin, hour_cos
+
+
+def scale_features(features: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Standardize each column as (x - mean) / scale, returned as float32 for DBSCAN.
+    """
+    return ((features - mean) / scale).astype(np.float32)
+
+
+def _scale_features_kernel(features: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Row-parallel loop form of scale_features, for Numba to compile.
+    """
+    n, n_features = features.shape
+    X = np.empty((n, n_features), dtype=np.float32)
+    for i in prange(n):
+        for j in range(n_features):
+            X[i, j] = (features[i, j] - mean[j]) / scale[j]
+    return X
+
 
+if njit is not None:
+    hour_features_from_epoch_ms = njit(parallel=True, fastmath=True, cache=True)(_hour_features_kernel)
+    scale_features = njit(parallel=True, fastmath=True, cache=True)(_scale_features_kernel)
 
-def load_data(path: str) -> pd.DataFrame:
+
+def load_data(path: str) -> Dict[str, dict]:
     """
-    Load JSON log data into a Pandas DataFrame.
+    Load JSON log data as a dict of records keyed by ID.
     """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+        return json.load(f)
 
-    df = pd.DataFrame.from_dict(raw, orient="index")
-    return df
+
+def build_features(raw: Dict[str, dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the (N, len(FEATURE_COLUMNS)) feature matrix straight from the
+    parsed records, without going through a DataFrame.
+    Also returns the fractional start hour, which is reported but not clustered on.
+    """
+    records = list(raw.values())
+    n = len(records)
+
+    X = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float64)
+    X[:, :3] = [(rec["file_len"], rec["ext_danger"], rec["transfer_delta_s"]) for rec in records]
+    start_ms = np.fromiter((rec["transfer_start_ms"] for rec in records), dtype=np.int64, count=n)
+
+    # Convert start time to hour-of-day (UTC), plus cyclical encoding of time:
+    # Ensures 23:59 and 00:01 are close in feature space
+    hour, X[:, 3], X[:, 4] = hour_features_from_epoch_ms(start_ms)
+    return X, hour
 
 
 # -----------------------------
@@ -62,44 +152,41 @@ def load_data(path: str) -> pd.DataFrame:
 
 def main() -> None:
     # ---- Load data ----
-    df = load_data(DATA_FILE)
+    raw = load_data(DATA_FILE)
 
     # ---- Feature engineering ----
-
-    # Convert start time to hour-of-day (UTC)
-    df["hour"] = df["transfer_start_ms"].apply(hour_fraction_from_epoch_ms)
-
-    # Cyclical encoding of time:
-    # Ensures 23:59 and 00:01 are close in feature space
-    df["hour_sin"] = np.sin(2 * np.pi * df["hour"] / 24)
-    df["hour_cos"] = np.cos(2 * np.pi * df["hour"] / 24)
-
-    # Select features for DBSCAN
-    # NOTE:
-    # - ext_id is excluded (categorical, redundant)
-    # - raw timestamps are excluded (distance meaningless)
-    features = df[
-        [
-            "file_len",
-            "ext_danger",
-            "transfer_delta_s",
-            "hour_sin",
-            "hour_cos",
-        ]
-    ]
+    features, hour = build_features(raw)
 
     # ---- Feature scaling ----
     # DBSCAN relies on distance; scaling is critical
-    scaler = StandardScaler()
-    X = scaler.fit_transform(features)
+    # Zero mean / unit variance per column, like StandardScaler; constant
+    # columns are only centred. Unit-scaled features have ample float32
+    # precision for EPS; halves the bytes DBSCAN's neighbour search has to stream.
+    mean = features.mean(axis=0)
+    scale = features.std(axis=0)
+    scale[scale == 0.0] = 1.0
+    X = scale_features(features, mean, scale)
 
     # ---- DBSCAN clustering ----
+    # Low-dimensional (5-D) data: a k-d tree prunes the range queries, and
+    # the per-point neighbour searches run on all cores.
     dbscan = DBSCAN(
         eps=EPS,
         min_samples=MIN_SAMPLES,
+        algorithm="kd_tree",
+        leaf_size=30,
+        n_jobs=-1,
     )
 
-    df["cluster"] = dbscan.fit_predict(X)
+    labels = dbscan.fit_predict(X)
+
+    # ---- Results table ----
+    # Only needed for reporting/export, so it is assembled after clustering
+    df = pd.DataFrame(list(raw.values()), index=list(raw.keys()))
+    df["hour"] = hour
+    df["hour_sin"] = features[:, 3]
+    df["hour_cos"] = features[:, 4]
+    df["cluster"] = labels
 
     # ---- Results summary ----
     print("\nCluster label counts:")
@@ -124,8 +211,13 @@ def main() -> None:
     )
 
     # Optional: save results for further analysis
-    df.to_csv("mockData_with_clusters.csv", index=True)
-    print("\nSaved results to mockData_with_clusters.csv")
+    if pyarrow is not None:
+        out_path = "mockData_with_clusters.parquet"
+        df.to_parquet(out_path, engine="pyarrow", compression="zstd", index=True)
+    else:
+        out_path = "mockData_with_clusters.csv"
+        df.to_csv(out_path, index=True, lineterminator="\n")
+    print(f"\nSaved results to {out_path}")
 
 
 # -----------------------------